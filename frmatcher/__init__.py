@@ -1,3 +1,3 @@
-from .fastq_file_name_checker import FastqFileNameChecker
+from .fastq_file_name_checker import FastqFileNameChecker, default_config_path
 
-__all__ = ["FastqFileNameChecker"]
+__all__ = ["FastqFileNameChecker", "default_config_path"]
@@ -1,10 +1,213 @@
+import copy
+import functools
+import itertools
 import os
 import re
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import files
+from typing import Any, Dict, List, Optional, Tuple
 
+import ahocorasick
 import yaml
 from loguru import logger
 
+try:
+    # Optional: RE2 matches in linear time with no backtracking, which suits
+    # the fused literal-heavy alternations compiled below.
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+try:
+    # Optional: Hyperscan compiles the whole pattern set into one vectorized
+    # multi-pattern database and replaces the automaton+regex path entirely.
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Prefer the libyaml C loader; the pure-Python SafeLoader is orders of
+# magnitude slower and dominates startup in short-lived invocations.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Delimiters that must follow an R1/R2 pattern match.
+_DELIMITERS = "._-"
+
+# Sentinel used to join basenames for the batched automaton scan; it never
+# occurs in filenames, so matches cannot span file boundaries and a match
+# ending at a name's last character sees the sentinel (not a delimiter).
+_SENTINEL = "\x00"
+
+# Categories in match-priority order: an ignore hit beats R1, which beats R2.
+_PRIORITY = ("ignore", "R1", "R2")
+
+# (category, configuration key, whether a delimiter must follow a match).
+_CATEGORY_SPECS = (
+    ("R1", "r1", True),
+    ("R2", "r2", True),
+    ("ignore", "ignore", False),
+)
+
+# Reserved key in CompiledPatterns holding the optional Hyperscan database
+# as a (database, {pattern_id: priority}) pair.
+_HYPERSCAN_KEY = "_hyperscan"
+
+# Below this many filenames, thread-pool overhead outweighs any parallel gain.
+_PARALLEL_THRESHOLD = 10_000
+
+# Characters that carry regex meaning; anything before the first one is the
+# literal core of a pattern.
+_REGEX_META = frozenset("\\^$.|?*+()[]{}")
+
+# Compiled matcher bundle:
+#   "automaton": one Aho-Corasick automaton over all literal patterns of all
+#       categories, payload per word a priority-sorted tuple of
+#       (priority, delimited) entries; None when there are no literals.
+#   "regex": per-category (fused alternation, prefilter tokens) pairs for the
+#       non-literal patterns.
+#   "literals": the automaton's (word, entries) pairs as a flat tuple, for
+#       the str.find specialization on uniform-length inputs.
+#   "_hyperscan": optional (database, {pattern_id: priority}) pair.
+CompiledPatterns = Dict[str, Any]
+
+
+def default_config_path() -> str:
+    """
+    Return the path to the pattern configuration bundled with the package.
+
+    Resolved through importlib.resources, which is C-backed and avoids the
+    installed-distribution metadata scan that pkg_resources performs at
+    import time.
+
+    Returns:
+        str: Filesystem path to the bundled patterns.yaml.
+    """
+    return str(files(__package__) / "config" / "patterns.yaml")
+
+
+def _compile_regex(pattern: str) -> Any:
+    """
+    Compile a pattern with RE2 when available, falling back to stdlib re.
+
+    RE2 rejects constructs it cannot run in linear time (backreferences,
+    lookaround); configs using such syntax worked with plain re before the
+    RE2 integration and must keep working.
+    """
+    if _regex_engine is not re:
+        try:
+            return _regex_engine.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+def _is_literal(pattern: str) -> bool:
+    """Return True if the pattern is a plain literal with no regex syntax."""
+    return re.escape(pattern) == pattern
+
+
+def _literal_core(pattern: str) -> str:
+    """Return the leading literal substring of a regex pattern, if any."""
+    core = []
+    for char in pattern.lstrip("^"):
+        if char in _REGEX_META:
+            break
+        core.append(char)
+    return "".join(core)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_patterns_cached(config_path: str, mtime: float) -> Dict[str, List[str]]:
+    """
+    Parse a YAML configuration file, cached on (path, mtime).
+
+    The mtime argument is only part of the cache key: it invalidates the
+    cached entry when the file changes on disk.
+    """
+    with open(config_path, "r") as file:
+        config = yaml.load(file, Loader=_YAML_LOADER)
+    return config["patterns"]
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_patterns_cached(
+    frozen_patterns: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> CompiledPatterns:
+    """
+    Build the compiled matchers for a frozen (hashable) pattern mapping.
+
+    Caching here means repeated checker instantiations with the same
+    configuration skip both automaton construction and regex compilation.
+    """
+    patterns = {key: list(values) for key, values in frozen_patterns}
+    compiled: CompiledPatterns = {"automaton": None, "regex": {}}
+
+    # All literal patterns share one automaton; each word carries the
+    # priority-sorted (priority, delimited) entries of its categories so one
+    # pass over the text classifies against every category at once.
+    literal_entries: Dict[str, List[Tuple[int, bool]]] = {}
+
+    for category, key, delimited in _CATEGORY_SPECS:
+        category_patterns = patterns.get(key, [])
+        if not category_patterns:
+            continue
+
+        priority = _PRIORITY.index(category)
+        literals = [p for p in category_patterns if _is_literal(p)]
+        regexes = [p for p in category_patterns if not _is_literal(p)]
+
+        for literal in literals:
+            literal_entries.setdefault(literal, []).append((priority, delimited))
+
+        if regexes:
+            alternation = f"(?:{'|'.join(regexes)})"
+            if delimited:
+                alternation += f"[{_DELIMITERS}]"
+            regex = _compile_regex(alternation)
+            # A prefilter is only sound if every regex has a literal core;
+            # one coreless pattern means the regex must always run.
+            cores = tuple(_literal_core(p) for p in regexes)
+            tokens = cores if all(cores) else None
+            compiled["regex"][category] = (regex, tokens)
+
+    compiled["literals"] = tuple(
+        (literal, tuple(sorted(entries)))
+        for literal, entries in literal_entries.items()
+    )
+    if literal_entries:
+        automaton = ahocorasick.Automaton()
+        for literal, entries in compiled["literals"]:
+            automaton.add_word(literal, entries)
+        automaton.make_automaton()
+        compiled["automaton"] = automaton
+
+    if hyperscan is not None:
+        expressions = []
+        priorities = {}
+        for category, key, delimited in _CATEGORY_SPECS:
+            for pattern in patterns.get(key, []):
+                expression = f"(?:{pattern})[{_DELIMITERS}]" if delimited else pattern
+                priorities[len(expressions)] = _PRIORITY.index(category)
+                expressions.append(expression.encode())
+        if expressions:
+            # Hyperscan rejects PCRE constructs it cannot vectorize
+            # (backreferences, lookaround); configs using such syntax worked
+            # with plain re and must keep working, so fall back to the
+            # automaton+regex path when the database will not compile.
+            try:
+                database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+                database.compile(
+                    expressions=expressions,
+                    ids=list(priorities),
+                    flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions),
+                )
+            except Exception:
+                pass
+            else:
+                compiled[_HYPERSCAN_KEY] = (database, priorities)
+
+    return compiled
+
 
 class FilenameLengthMismatchError(ValueError):
     """Custom exception for filename length mismatches."""
@@ -15,6 +218,17 @@ class PatternsNotLoadedError(ValueError):
 
 
 class FastqFileNameChecker:
+    # Pipelines create many short-lived checker instances; slots drop the
+    # per-instance __dict__ and speed up attribute access in the hot paths.
+    __slots__ = (
+        "filenames",
+        "_basenames",
+        "verbose",
+        "patterns",
+        "compiled_patterns",
+        "_uniform_length",
+    )
+
     def __init__(
         self,
         filenames: List[str],
@@ -40,14 +254,16 @@ class FastqFileNameChecker:
             yaml.YAMLError: If the configuration file is invalid.
         """
         self.filenames = filenames
+        # Parallel array of basenames, derived once; categorization works on
+        # indices into these two lists rather than re-deriving per call.
+        self._basenames = [os.path.basename(full_path) for full_path in filenames]
         self.verbose = verbose
 
-        # Configure logging
+        # Configure logging: loguru handles the rare error-path messages only.
+        # Debug output is gated on the plain verbose flag instead of a DEBUG
+        # sink, so verbose runs never pay loguru's dispatch stack per call.
         logger.remove()  # Remove the default handler
-        if self.verbose:
-            logger.add(lambda msg: print(msg, end=""), level="DEBUG", colorize=True)
-        else:
-            logger.add(lambda msg: print(msg, end=""), level="ERROR", colorize=True)
+        logger.add(lambda msg: print(msg, end=""), level="ERROR", colorize=True)
 
         # Only load patterns from config if no patterns are directly injected
         if config_path is None and not hasattr(self, "patterns"):
@@ -59,8 +275,14 @@ class FastqFileNameChecker:
         if self.patterns:
             self.compiled_patterns = self.compile_patterns(self.patterns)
 
+        # A passed length check opts literal-only pattern sets into the
+        # str.find specialization. It runs on full paths, not basenames, so
+        # it proves nothing about name structure; the find path is correct
+        # regardless and the flag only selects it.
+        self._uniform_length = False
         if length_check:
             self._check_filename_lengths()
+            self._uniform_length = True
 
     def load_patterns(self, config_path: str) -> Dict[str, List[str]]:
         """
@@ -81,39 +303,246 @@ class FastqFileNameChecker:
             raise FileNotFoundError(f"Configuration file not found at {config_path}")
 
         try:
-            with open(config_path, "r") as file:
-                config = yaml.safe_load(file)
-            return config["patterns"]
+            # Deep-copy so callers mutating their patterns dict cannot
+            # corrupt the cached entry shared by later loads.
+            return copy.deepcopy(
+                _load_patterns_cached(config_path, os.path.getmtime(config_path))
+            )
         except yaml.YAMLError as e:
             logger.error(f"Error parsing YAML configuration: {e}")
             raise
 
-    def compile_patterns(
-        self, patterns: Dict[str, List[str]]
-    ) -> Dict[str, List[re.Pattern]]:
+    def compile_patterns(self, patterns: Dict[str, List[str]]) -> CompiledPatterns:
         """
-        Compile regex patterns for R1, R2, and ignore categories.
+        Compile matchers for the R1, R2, and ignore categories.
+
+        Literal patterns (the vast majority, e.g. ``_1``, ``_R1``) of all
+        categories go into one unified Aho-Corasick automaton whose payloads
+        carry category priority, so each filename is scanned in a single
+        linear pass regardless of the number of patterns. Patterns that
+        use real regex syntax (e.g. ``_i\\d+``) are fused into one alternation
+        regex per category as a fallback. Results are cached, so instances
+        created with identical patterns share the compiled matchers.
 
         Args:
             patterns (Dict[str, List[str]]): Raw patterns from configuration.
 
         Returns:
-            Dict[str, List[re.Pattern]]: Compiled regex patterns.
-        """
-        compiled = {
-            "R1": [
-                re.compile(f".*({pattern})([._-]).*")
-                for pattern in patterns.get("r1", [])
-            ],
-            "R2": [
-                re.compile(f".*({pattern})([._-]).*")
-                for pattern in patterns.get("r2", [])
-            ],
-            "ignore": [
-                re.compile(f".*({pattern}).*") for pattern in patterns.get("ignore", [])
-            ],
-        }
-        return compiled
+            CompiledPatterns: An (automaton, regex) pair per non-empty category.
+        """
+        frozen_patterns = tuple(
+            sorted((key, tuple(values)) for key, values in patterns.items())
+        )
+        return _compile_patterns_cached(frozen_patterns)
+
+    def _match_priorities(self, basenames: List[str]) -> List[int]:
+        """
+        Compute the best matching category priority for each basename.
+
+        All basenames are joined with a sentinel character and scanned in one
+        pass of the unified automaton; match end-offsets are mapped back
+        to file indices via bisect over cumulative lengths. The regex
+        fallback (non-literal patterns) still runs per file, guarded by its
+        literal-core prefilter.
+
+        Args:
+            basenames (List[str]): Basenames, in the same order as filenames.
+
+        Returns:
+            List[int]: For each basename, the index into _PRIORITY of the
+                highest-priority matching category, or len(_PRIORITY) if
+                nothing matched.
+        """
+        compiled = self.compiled_patterns
+
+        hyperscan_db = compiled.get(_HYPERSCAN_KEY)
+        if hyperscan_db is not None:
+            return self._match_priorities_hyperscan(basenames, *hyperscan_db)
+
+        # Literal-only pattern sets on length-checked inputs collapse to
+        # plain str.find scans (C-level memmem) with an O(1) delimiter
+        # check. Unreachable with the bundled config, whose regex-only
+        # ignore patterns keep the "regex" mapping non-empty.
+        literals = compiled.get("literals")
+        if self._uniform_length and literals is not None and not compiled.get("regex"):
+            return self._match_priorities_find(basenames, literals)
+
+        no_match = len(_PRIORITY)
+        best = [no_match] * len(basenames)
+
+        text = _SENTINEL.join(basenames)
+        text_length = len(text)
+
+        # Fast path: if no R1/R2 pattern can occur anywhere in the joined
+        # text, every file ends up ignored regardless of ignore hits, so the
+        # category scans and per-file fallbacks can be skipped outright.
+        if not self._any_read_pattern_possible(text):
+            return best
+        # offsets[i] is the position one past basename i's trailing sentinel;
+        # bisect_right over it maps a match end-offset to its file index.
+        offsets = list(itertools.accumulate(len(name) + 1 for name in basenames))
+
+        # One pass over the joined text covers all categories; each word's
+        # entries are priority-sorted, so the first entry whose delimiter
+        # requirement holds is the best this hit can contribute.
+        automaton = compiled.get("automaton")
+        if automaton is not None:
+            for end_index, entries in automaton.iter(text):
+                follow = end_index + 1
+                delimiter_ok = follow < text_length and text[follow] in _DELIMITERS
+                for priority, delimited in entries:
+                    if delimited and not delimiter_ok:
+                        continue
+                    file_index = bisect_right(offsets, end_index)
+                    if priority < best[file_index]:
+                        best[file_index] = priority
+                    break
+
+        for category, (regex, tokens) in compiled.get("regex", {}).items():
+            priority = _PRIORITY.index(category)
+            for file_index, filename in enumerate(basenames):
+                if best[file_index] <= priority:
+                    continue
+                if tokens is not None and not any(t in filename for t in tokens):
+                    continue
+                if regex.search(filename):
+                    best[file_index] = priority
+
+        return best
+
+    def _any_read_pattern_possible(self, text: str) -> bool:
+        """
+        Check whether any R1/R2 pattern could match somewhere in the text.
+
+        Used as a bulk early-reject over the joined basenames: one scan of
+        the whole text is far cheaper than per-file classification when
+        nothing can match (e.g. metadata-only file lists). Conservative —
+        returns True whenever a match cannot be ruled out.
+
+        Args:
+            text (str): All basenames joined with the sentinel.
+
+        Returns:
+            bool: False only if no R1/R2 pattern occurs anywhere in the text.
+        """
+        automaton = self.compiled_patterns.get("automaton")
+        if automaton is not None:
+            for _, entries in automaton.iter(text):
+                if any(priority > 0 for priority, _ in entries):
+                    return True
+
+        regex_fallbacks = self.compiled_patterns.get("regex", {})
+        for category in ("R1", "R2"):
+            if category not in regex_fallbacks:
+                continue
+            _, tokens = regex_fallbacks[category]
+            if tokens is None or any(t in text for t in tokens):
+                return True
+        return False
+
+    def _match_priorities_find(
+        self,
+        basenames: List[str],
+        literals: Tuple[Tuple[str, Tuple[Tuple[int, bool], ...]], ...],
+    ) -> List[int]:
+        """
+        Compute per-basename category priorities with plain str.find scans.
+
+        Selected when length_check passed and every pattern is a literal.
+        Correctness does not depend on filename lengths (the length check
+        runs on full paths, not basenames); the flag merely opts in. Each
+        word is located with C-level substring search and the delimiter
+        constraint becomes a single character test.
+
+        Args:
+            basenames (List[str]): Basenames, in the same order as filenames.
+            literals (Tuple): The compiled (word, entries) pairs.
+
+        Returns:
+            List[int]: Per-basename category priorities, in input order.
+        """
+        no_match = len(_PRIORITY)
+        best = [no_match] * len(basenames)
+
+        for file_index, filename in enumerate(basenames):
+            length = len(filename)
+            for word, entries in literals:
+                start = filename.find(word)
+                while start != -1:
+                    follow = start + len(word)
+                    delimiter_ok = follow < length and filename[follow] in _DELIMITERS
+                    for priority, delimited in entries:
+                        if delimited and not delimiter_ok:
+                            continue
+                        if priority < best[file_index]:
+                            best[file_index] = priority
+                        break
+                    start = filename.find(word, start + 1)
+
+        return best
+
+    def _match_priorities_hyperscan(
+        self, basenames: List[str], database, priorities: Dict[int, int]
+    ) -> List[int]:
+        """
+        Compute per-basename category priorities with a Hyperscan database.
+
+        Each basename is scanned once against the whole pattern set; the
+        match callback keeps the highest-priority (lowest index) category
+        seen per file.
+
+        Args:
+            basenames (List[str]): Basenames, in the same order as filenames.
+            database: Compiled block-mode hyperscan.Database.
+            priorities (Dict[int, int]): Pattern id to _PRIORITY index.
+
+        Returns:
+            List[int]: Per-basename category priorities, in input order.
+        """
+        no_match = len(_PRIORITY)
+        best = [no_match] * len(basenames)
+
+        for file_index, filename in enumerate(basenames):
+
+            def on_match(pattern_id, start, end, flags, context=None):
+                priority = priorities[pattern_id]
+                if priority < best[file_index]:
+                    best[file_index] = priority
+
+            database.scan(filename.encode(), match_event_handler=on_match)
+
+        return best
+
+    def _match_priorities_parallel(self, basenames: List[str]) -> List[int]:
+        """
+        Parallel variant of _match_priorities for large filename lists.
+
+        Splits the basenames into one contiguous chunk per CPU and scans the
+        chunks in a thread pool; the automaton and regex matchers are
+        read-only and shared safely between workers. The Hyperscan path is
+        excluded: its database has a single scratch space that must not be
+        used from concurrent scan calls, so it always runs serially.
+
+        Args:
+            basenames (List[str]): Basenames, in the same order as filenames.
+
+        Returns:
+            List[int]: Per-basename category priorities, in input order.
+        """
+        if self.compiled_patterns.get(_HYPERSCAN_KEY) is not None:
+            return self._match_priorities(basenames)
+
+        workers = os.cpu_count() or 1
+        if workers <= 1:
+            return self._match_priorities(basenames)
+
+        chunk_size = -(-len(basenames) // workers)  # ceil division
+        chunks = [
+            basenames[i : i + chunk_size] for i in range(0, len(basenames), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self._match_priorities, chunks)
+        return [priority for chunk in results for priority in chunk]
 
     def _check_filename_lengths(self) -> None:
         """
@@ -122,22 +551,33 @@ class FastqFileNameChecker:
         Raises:
             FilenameLengthMismatchError: If filenames do not have the same length.
         """
-        lengths = list(map(len, self.filenames))
-        if len(set(lengths)) > 1:
-            logger.error(
-                "Filenames do not all have the same length. Please ensure all filenames are consistent."
-            )
-            raise FilenameLengthMismatchError(
-                "Filenames do not all have the same length. Please ensure all filenames are consistent."
-            )
-
-    def categorize_fastq_files(self) -> Dict[str, List[str]]:
+        iterator = iter(self.filenames)
+        first = next(iterator, None)
+        if first is None:
+            return
+
+        expected_length = len(first)
+        for filename in iterator:
+            if len(filename) != expected_length:
+                logger.error(
+                    "Filenames do not all have the same length. Please ensure all filenames are consistent."
+                )
+                raise FilenameLengthMismatchError(
+                    "Filenames do not all have the same length. Please ensure all filenames are consistent."
+                )
+
+    def categorize_fastq_files(self, sort: bool = True) -> Dict[str, Tuple[str, ...]]:
         """
         Categorizes FASTQ files into R1, R2, or ignored based on filename patterns.
 
+        Args:
+            sort (bool): Whether to sort each category alphabetically.
+                Callers that do not need sorted output can pass False to skip
+                the O(N log N) pass. Default is True.
+
         Returns:
-            Dict[str, List[str]]: A dictionary with keys 'R1', 'R2', and 'ignored',
-                each containing lists of full file paths.
+            Dict[str, Tuple[str, ...]]: A dictionary with keys 'R1', 'R2', and
+                'ignored', each containing a tuple of full file paths.
 
         Raises:
             PatternsNotLoadedError: If regex patterns are not loaded.
@@ -146,33 +586,37 @@ class FastqFileNameChecker:
         if not hasattr(self, "compiled_patterns"):
             raise PatternsNotLoadedError("Patterns not loaded or compiled.")
 
-        categorized_files: Dict[str, List[str]] = {"R1": [], "R2": [], "ignored": []}
-
-        for full_path in self.filenames:
-            filename = os.path.basename(full_path)
-            if any(
-                pattern.search(filename) for pattern in self.compiled_patterns["ignore"]
-            ):
-                categorized_files["ignored"].append(full_path)
-            elif any(
-                pattern.search(filename) for pattern in self.compiled_patterns["R1"]
-            ):
-                categorized_files["R1"].append(full_path)
-            elif any(
-                pattern.search(filename) for pattern in self.compiled_patterns["R2"]
-            ):
-                categorized_files["R2"].append(full_path)
-            else:
-                categorized_files["ignored"].append(full_path)
+        # One batched scan over all basenames; unmatched files are ignored.
+        # Large lists are split across worker threads, small ones stay serial.
+        basenames = self._basenames
+        if len(basenames) > _PARALLEL_THRESHOLD:
+            priorities = self._match_priorities_parallel(basenames)
+        else:
+            priorities = self._match_priorities(basenames)
 
-        # Sort the filenames alphabetically in each category
-        for category in categorized_files:
-            categorized_files[category].sort()
+        # Bucket indices first, then materialize paths once per category.
+        category_indices: Dict[str, List[int]] = {"R1": [], "R2": [], "ignored": []}
+        buckets = ("ignored", "R1", "R2", "ignored")
+        for file_index, priority in enumerate(priorities):
+            category_indices[buckets[priority]].append(file_index)
+
+        # Materialize each category as a frozen tuple (sorted on request) so
+        # callers can zip R1 with R2 without defensive copies.
+        categorized_files: Dict[str, Tuple[str, ...]] = {}
+        for category, indices in category_indices.items():
+            paths = [self.filenames[i] for i in indices]
+            categorized_files[category] = tuple(sorted(paths) if sort else paths)
 
         # Check if the number of R1 and R2 files is balanced
         len_r1 = len(categorized_files.get("R1", []))
         len_r2 = len(categorized_files.get("R2", []))
 
+        if self.verbose:
+            print(
+                f"Categorized {len(self.filenames)} files: R1={len_r1}, "
+                f"R2={len_r2}, ignored={len(categorized_files['ignored'])}"
+            )
+
         if len_r1 != len_r2:
             logger.error(f"Unbalanced categories: R1={len_r1}, R2={len_r2}")
             raise FilenameLengthMismatchError(
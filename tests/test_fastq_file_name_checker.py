@@ -3,7 +3,7 @@ import unittest
 import yaml
 
 # Adjust the import according to your module structure
-from frmatcher import FastqFileNameChecker
+from frmatcher import FastqFileNameChecker, default_config_path
 
 
 class TestFastqFileNameChecker(unittest.TestCase):
@@ -67,6 +67,101 @@ class TestFastqFileNameChecker(unittest.TestCase):
         with self.subTest("Ignored Categorization"):
             self.assertEqual(set(categorized_files["ignored"]), expected_ignored)
 
+    def test_bundled_config_overlapping_literals(self):
+        # The bundled config mixes single-character literals (_r, _R, _F,
+        # _f) with their longer _r1/_r2 forms; each name must land in the
+        # category of the pattern it actually completes.
+        filenames = [
+            "sample_F.fastq.gz",  # R1 via _F
+            "sample_f.fastq.gz",  # R2 via _f
+            "sample_r_L001.fastq.gz",  # R1 via _r
+            "sample_R_L001.fastq.gz",  # R2 via _R
+            "sample_r1_L001.fastq.gz",  # R1 via _r1 (not _r: no delimiter)
+            "sample_r2_L001.fastq.gz",  # R2 via _r2 (not _r: no delimiter)
+        ]
+
+        checker = FastqFileNameChecker(filenames, config_path=default_config_path())
+        categorized_files = checker.categorize_fastq_files()
+
+        self.assertEqual(
+            set(categorized_files["R1"]),
+            {
+                "sample_F.fastq.gz",
+                "sample_r_L001.fastq.gz",
+                "sample_r1_L001.fastq.gz",
+            },
+        )
+        self.assertEqual(
+            set(categorized_files["R2"]),
+            {
+                "sample_f.fastq.gz",
+                "sample_R_L001.fastq.gz",
+                "sample_r2_L001.fastq.gz",
+            },
+        )
+        self.assertEqual(categorized_files["ignored"], ())
+
+    def test_ignore_beats_read_patterns(self):
+        # Files matching both an ignore pattern and an R1/R2 pattern must be
+        # ignored regardless of match order or position.
+        filenames = [
+            "sample_1_i7.fastq.gz",  # _1 (R1) but also _i7 (ignore)
+            "i_sample_2_L001.fastq.gz",  # _2 (R2) but also i_ prefix (ignore)
+        ]
+
+        checker = FastqFileNameChecker(filenames, config_path=default_config_path())
+        categorized_files = checker.categorize_fastq_files()
+
+        self.assertEqual(categorized_files["R1"], ())
+        self.assertEqual(categorized_files["R2"], ())
+        self.assertEqual(set(categorized_files["ignored"]), set(filenames))
+
+    def test_pattern_at_end_of_name_is_not_a_read(self):
+        # R1/R2 patterns require a trailing delimiter; a pattern sitting at
+        # the very end of the name must not count as a match.
+        filenames = ["sample_R1", "sample_2"]
+
+        checker = FastqFileNameChecker(filenames, config_path=default_config_path())
+        categorized_files = checker.categorize_fastq_files()
+
+        self.assertEqual(categorized_files["R1"], ())
+        self.assertEqual(categorized_files["R2"], ())
+        self.assertEqual(set(categorized_files["ignored"]), set(filenames))
+
+    def test_literal_only_length_checked_specialization(self):
+        # A literal-only pattern set plus length_check=True selects the
+        # str.find fast path; it must agree with the automaton path.
+        patterns = {
+            "r1": ["_1", "_R1"],
+            "r2": ["_2", "_R2"],
+        }
+
+        filenames = [
+            "aa_1_X.fq",
+            "aa_2_X.fq",
+            "a_R1_X.fq",
+            "a_R2_X.fq",
+        ]
+
+        checked = FastqFileNameChecker(filenames, length_check=True)
+        checked.patterns = patterns
+        checked.compiled_patterns = checked.compile_patterns(patterns)
+
+        unchecked = FastqFileNameChecker(filenames)
+        unchecked.patterns = patterns
+        unchecked.compiled_patterns = unchecked.compile_patterns(patterns)
+
+        expected = {
+            "R1": ("a_R1_X.fq", "aa_1_X.fq"),
+            "R2": ("a_R2_X.fq", "aa_2_X.fq"),
+            "ignored": (),
+        }
+
+        self.assertEqual(checked.categorize_fastq_files(), expected)
+        self.assertEqual(
+            checked.categorize_fastq_files(), unchecked.categorize_fastq_files()
+        )
+
 
 if __name__ == "__main__":
     unittest.main()